@@ -4,14 +4,29 @@ from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
+
 from mazewright.maze import Cell, Maze, Wall
 from mazewright.algorithms import backtracker, kruskal, prim
 
+try:
+    from mazewright.algorithms._backtracker_nb import (
+        generate_batch_kernel as _batch_kernel,
+    )
+except ImportError:  # Numba is optional; fall back to per-maze generation
+    _batch_kernel = None
+
 __version__ = "0.1.0"
-__all__ = ["Maze", "Cell", "Wall", "generate"]
+__all__ = ["Maze", "Cell", "Wall", "generate", "generate_batch"]
 
 AlgorithmType = Literal["backtracker", "prim", "kruskal"]
 
+_ALGORITHMS = {
+    "backtracker": backtracker.generate,
+    "prim": prim.generate,
+    "kruskal": kruskal.generate,
+}
+
 
 def generate(
     rows: int,
@@ -39,17 +54,61 @@ def generate(
     maze = Maze(rows, cols)
 
     # Select and run algorithm
-    algorithms = {
-        "backtracker": backtracker.generate,
-        "prim": prim.generate,
-        "kruskal": kruskal.generate,
-    }
+    generator = _ALGORITHMS.get(algorithm)
+    if generator is None:
+        raise ValueError(
+            f"Unknown algorithm: {algorithm}. "
+            f"Choose from: {', '.join(_ALGORITHMS.keys())}"
+        )
+
+    generator(maze)
+    return maze
+
+
+def generate_batch(
+    n: int,
+    rows: int,
+    cols: int,
+    algorithm: AlgorithmType = "backtracker",
+) -> np.ndarray:
+    """Generate many mazes into one contiguous wall array.
+
+    Bulk workflows (dataset generation, benchmarking) pay per-call
+    allocation overhead in :func:`generate`; this allocates a single
+    ``(n, rows, cols)`` uint8 buffer up front and, when the optional
+    ``numba`` dependency is installed and the backtracker is selected,
+    fills the slabs in parallel across CPU cores.
+
+    Args:
+        n: Number of mazes to generate
+        rows: Number of rows per maze
+        cols: Number of columns per maze
+        algorithm: Algorithm to use ("backtracker", "prim", or "kruskal")
 
-    if algorithm not in algorithms:
+    Returns:
+        uint8 array of shape (n, rows, cols) holding wall bitmasks;
+        wrap individual slabs with :meth:`Maze.from_array` as needed.
+
+    Raises:
+        ValueError: If dimensions are invalid or algorithm is unknown
+    """
+    if n < 0:
+        raise ValueError("Batch size must be non-negative")
+    if rows <= 0 or cols <= 0:
+        raise ValueError("Maze dimensions must be positive")
+    if algorithm not in _ALGORITHMS:
         raise ValueError(
             f"Unknown algorithm: {algorithm}. "
-            f"Choose from: {', '.join(algorithms.keys())}"
+            f"Choose from: {', '.join(_ALGORITHMS.keys())}"
         )
 
-    algorithms[algorithm](maze)
-    return maze
\ No newline at end of file
+    out = np.empty((n, rows, cols), dtype=np.uint8)
+
+    if algorithm == "backtracker" and _batch_kernel is not None and n > 0:
+        seeds = np.random.SeedSequence().generate_state(n).astype(np.int64)
+        _batch_kernel(out, rows, cols, seeds)
+    else:
+        for i in range(n):
+            out[i] = generate(rows, cols, algorithm=algorithm).walls
+
+    return out
\ No newline at end of file
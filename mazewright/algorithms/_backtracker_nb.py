@@ -0,0 +1,110 @@
+"""Numba-compiled kernel for the recursive backtracker.
+
+This module is only importable when the optional ``numba`` dependency is
+installed; ``backtracker.generate`` falls back to the pure-Python
+implementation otherwise.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+# Wall flags as plain ints; Numba kernels cannot use the IntFlag enum.
+_NORTH = 1
+_EAST = 2
+_SOUTH = 4
+_WEST = 8
+_ALL = 15
+
+
+@njit(cache=True)
+def generate_kernel(
+    walls: np.ndarray, rows: int, cols: int, seed: int
+) -> None:  # pragma: no cover - exercised via backtracker.generate
+    """Run the randomized DFS directly on the uint8 wall array.
+
+    Args:
+        walls: (rows, cols) uint8 wall bitmask array, modified in-place
+        rows: Number of rows
+        cols: Number of columns
+        seed: Seed for Numba's random state
+    """
+    np.random.seed(seed)
+    walls[:, :] = _ALL
+
+    visited = np.zeros((rows, cols), dtype=np.bool_)
+    stack = np.empty((rows * cols, 2), dtype=np.int32)
+    # Candidate neighbors: (row, col, wall, opposite) per entry.
+    cand = np.empty((4, 4), dtype=np.int32)
+
+    row = np.random.randint(0, rows)
+    col = np.random.randint(0, cols)
+    visited[row, col] = True
+    stack[0, 0] = row
+    stack[0, 1] = col
+    top = 0
+
+    while top >= 0:
+        row = stack[top, 0]
+        col = stack[top, 1]
+
+        # Gather unvisited neighbors with inlined bounds checks.
+        n = 0
+        if row > 0 and not visited[row - 1, col]:
+            cand[n, 0] = row - 1
+            cand[n, 1] = col
+            cand[n, 2] = _NORTH
+            cand[n, 3] = _SOUTH
+            n += 1
+        if col < cols - 1 and not visited[row, col + 1]:
+            cand[n, 0] = row
+            cand[n, 1] = col + 1
+            cand[n, 2] = _EAST
+            cand[n, 3] = _WEST
+            n += 1
+        if row < rows - 1 and not visited[row + 1, col]:
+            cand[n, 0] = row + 1
+            cand[n, 1] = col
+            cand[n, 2] = _SOUTH
+            cand[n, 3] = _NORTH
+            n += 1
+        if col > 0 and not visited[row, col - 1]:
+            cand[n, 0] = row
+            cand[n, 1] = col - 1
+            cand[n, 2] = _WEST
+            cand[n, 3] = _EAST
+            n += 1
+
+        if n > 0:
+            k = np.random.randint(0, n)
+            nr = cand[k, 0]
+            nc = cand[k, 1]
+
+            # Carve passage between current cell and chosen neighbor
+            walls[row, col] &= np.uint8(_ALL ^ cand[k, 2])
+            walls[nr, nc] &= np.uint8(_ALL ^ cand[k, 3])
+
+            visited[nr, nc] = True
+            top += 1
+            stack[top, 0] = nr
+            stack[top, 1] = nc
+        else:
+            # Dead end, backtrack
+            top -= 1
+
+
+@njit(cache=True, parallel=True)
+def generate_batch_kernel(
+    out: np.ndarray, rows: int, cols: int, seeds: np.ndarray
+) -> None:  # pragma: no cover - exercised via mazewright.generate_batch
+    """Fill each slab of a (n, rows, cols) wall array in parallel.
+
+    Args:
+        out: (n, rows, cols) uint8 array, modified in-place
+        rows: Number of rows per maze
+        cols: Number of columns per maze
+        seeds: Per-maze seeds, one per slab
+    """
+    for i in prange(out.shape[0]):
+        generate_kernel(out[i], rows, cols, seeds[i])
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from mazewright.maze import Maze
+import numpy as np
+
+from mazewright.maze import Maze
+
+try:
+    from mazewright.algorithms._backtracker_nb import generate_kernel as _kernel
+except ImportError:  # Numba is optional; fall back to pure Python
+    _kernel = None
 
 
 def generate(maze: Maze) -> None:
@@ -14,46 +19,63 @@ def generate(maze: Maze) -> None:
 
     This algorithm performs a randomized depth-first search through the grid,
     carving passages as it goes and backtracking when it hits dead ends.
+    When the optional ``numba`` dependency is installed, the DFS runs as a
+    compiled kernel directly on the wall array.
 
     Args:
         maze: The maze to generate into (will be modified in-place)
     """
+    if _kernel is not None:
+        _kernel(maze.walls, maze.rows, maze.cols, random.getrandbits(32))
+        return
+
+    _generate_py(maze)
+
+
+def _generate_py(maze: Maze) -> None:
+    """Pure-Python fallback for :func:`generate`."""
     # Reset maze to all walls
     maze.reset()
 
+    rows, cols = maze.rows, maze.cols
+    dirs = Maze.DIRS
+
     # Stack for DFS
     stack: list[tuple[int, int]] = []
 
     # Track visited cells
-    visited = [[False] * maze.cols for _ in range(maze.rows)]
+    visited = np.zeros((rows, cols), dtype=np.bool_)
 
     # Start from random cell
-    start_row = random.randint(0, maze.rows - 1)
-    start_col = random.randint(0, maze.cols - 1)
+    start_row = random.randint(0, rows - 1)
+    start_col = random.randint(0, cols - 1)
 
     # Mark starting cell as visited and push to stack
-    visited[start_row][start_col] = True
+    visited[start_row, start_col] = True
     stack.append((start_row, start_col))
 
     while stack:
         current_row, current_col = stack[-1]
 
-        # Get unvisited neighbors
-        unvisited_neighbors = []
-        for nr, nc, direction, opposite in maze.neighbors(current_row, current_col):
-            if not visited[nr][nc]:
-                unvisited_neighbors.append((nr, nc, direction, opposite))
-
-        if unvisited_neighbors:
-            # Choose random unvisited neighbor
-            nr, nc, direction, opposite = random.choice(unvisited_neighbors)
-
+        # Pick a uniformly random unvisited neighbor by reservoir
+        # sampling: the k-th candidate replaces the pick with probability
+        # 1/k, so no candidate list is allocated per step.
+        count = 0
+        for dr, dc, direction, _ in dirs:
+            nr = current_row + dr
+            nc = current_col + dc
+            if 0 <= nr < rows and 0 <= nc < cols and not visited[nr, nc]:
+                count += 1
+                if random.random() * count < 1.0:
+                    chosen_row, chosen_col, chosen_dir = nr, nc, direction
+
+        if count:
             # Carve passage between current and chosen neighbor
-            maze.carve(current_row, current_col, nr, nc)
+            maze._carve(current_row, current_col, chosen_dir)
 
             # Mark neighbor as visited and push to stack
-            visited[nr][nc] = True
-            stack.append((nr, nc))
+            visited[chosen_row, chosen_col] = True
+            stack.append((chosen_row, chosen_col))
         else:
             # Dead end, backtrack
             stack.pop()
\ No newline at end of file
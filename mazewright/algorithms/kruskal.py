@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import random
+from array import array
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from mazewright.maze import Wall
+
 if TYPE_CHECKING:
     from mazewright.maze import Maze
 
@@ -18,8 +23,10 @@ class UnionFind:
         Args:
             size: Number of elements (cells in maze)
         """
-        self.parent = list(range(size))
-        self.rank = [0] * size
+        self.parent = array("i", range(size))
+        # Rank never exceeds log2(size), so one unsigned byte per element
+        # is plenty; bytearray indexing is also cheaper than array('b').
+        self.rank = bytearray(size)
 
     def find(self, x: int) -> int:
         """Find root of element with path compression.
@@ -30,9 +37,18 @@ class UnionFind:
         Returns:
             Root element
         """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Path compression
-        return self.parent[x]
+        parent = self.parent
+
+        # First pass: locate the root.
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # Second pass: compress the path onto the root.
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
 
     def union(self, x: int, y: int) -> bool:
         """Union two sets by rank.
@@ -75,35 +91,44 @@ def generate(maze: Maze) -> None:
     # Reset maze to all walls
     maze.reset()
 
+    rows, cols = maze.rows, maze.cols
+
     # Create union-find structure
-    num_cells = maze.rows * maze.cols
+    num_cells = rows * cols
     uf = UnionFind(num_cells)
 
-    # Helper to convert (row, col) to single index
-    def cell_index(row: int, col: int) -> int:
-        return row * maze.cols + col
-
-    # Collect all possible walls (edges between cells)
-    walls: list[tuple[int, int, int, int]] = []
-
-    for row in range(maze.rows):
-        for col in range(maze.cols):
-            # Only add walls to neighbors that come after in iteration order
-            # to avoid duplicates
-            if col < maze.cols - 1:  # East wall
-                walls.append((row, col, row, col + 1))
-            if row < maze.rows - 1:  # South wall
-                walls.append((row, col, row + 1, col))
-
-    # Shuffle walls for random selection
-    random.shuffle(walls)
-
-    # Process walls
-    for r1, c1, r2, c2 in walls:
-        idx1 = cell_index(r1, c1)
-        idx2 = cell_index(r2, c2)
+    # Collect all edges between adjacent cells as two parallel int32
+    # arrays of flat cell indices (east edges, then south edges). This
+    # avoids building ~2*rows*cols Python tuples.
+    index = np.arange(num_cells, dtype=np.int32).reshape(rows, cols)
+    u = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    v = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+    num_east = rows * (cols - 1)
+
+    # Shuffle a permutation of edge indices instead of the edges
+    # themselves: a Fisher-Yates pass over 4-byte ints in C, rather than
+    # tuple-pointer swaps in the interpreter. The generator is seeded
+    # from the stdlib random module so random.seed() keeps this
+    # algorithm reproducible like the other generators.
+    perm = np.arange(len(u), dtype=np.int32)
+    np.random.default_rng(random.getrandbits(64)).shuffle(perm)
+
+    # A spanning tree has exactly num_cells - 1 edges; once that many are
+    # carved the remaining shuffled edges are all redundant.
+    needed = num_cells - 1
+    carved = 0
+
+    # Process edges in shuffled order
+    for k in perm:
+        a = int(u[k])
+        b = int(v[k])
 
         # If cells are in different sets, carve passage and union
-        if uf.find(idx1) != uf.find(idx2):
-            maze.carve(r1, c1, r2, c2)
-            uf.union(idx1, idx2)
\ No newline at end of file
+        if uf.find(a) != uf.find(b):
+            r1, c1 = divmod(a, cols)
+            direction = Wall.EAST if k < num_east else Wall.SOUTH
+            maze._carve(r1, c1, direction)
+            uf.union(a, b)
+            carved += 1
+            if carved == needed:
+                break
\ No newline at end of file
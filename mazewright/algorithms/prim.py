@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from mazewright.maze import Maze
+import numpy as np
+
+from mazewright.maze import Maze, Wall
 
 
 def generate(maze: Maze) -> None:
@@ -22,41 +22,50 @@ def generate(maze: Maze) -> None:
     # Reset maze to all walls
     maze.reset()
 
+    rows, cols = maze.rows, maze.cols
+    dirs = Maze.DIRS
+
     # Track visited cells
-    visited = [[False] * maze.cols for _ in range(maze.rows)]
+    visited = np.zeros((rows, cols), dtype=np.bool_)
 
-    # Frontier: list of (row, col, neighbor_row, neighbor_col) tuples
-    frontier: list[tuple[int, int, int, int]] = []
+    # Frontier: (row, col, neighbor_row, neighbor_col, direction) tuples
+    frontier: list[tuple[int, int, int, int, Wall]] = []
 
     # Start from random cell
-    start_row = random.randint(0, maze.rows - 1)
-    start_col = random.randint(0, maze.cols - 1)
+    start_row = random.randint(0, rows - 1)
+    start_col = random.randint(0, cols - 1)
 
     # Mark starting cell as visited
-    visited[start_row][start_col] = True
+    visited[start_row, start_col] = True
 
     # Add all walls of starting cell to frontier
-    for nr, nc, _, _ in maze.neighbors(start_row, start_col):
-        if not visited[nr][nc]:
-            frontier.append((start_row, start_col, nr, nc))
+    for dr, dc, direction, _ in dirs:
+        nr = start_row + dr
+        nc = start_col + dc
+        if 0 <= nr < rows and 0 <= nc < cols:
+            frontier.append((start_row, start_col, nr, nc, direction))
 
     while frontier:
-        # Pick random wall from frontier
-        idx = random.randint(0, len(frontier) - 1)
-        r1, c1, r2, c2 = frontier.pop(idx)
+        # Pick random wall from frontier. Swap it with the last entry and
+        # pop from the end so removal is O(1); order is irrelevant, so
+        # selection stays uniform over the current set.
+        idx = random.randrange(len(frontier))
+        frontier[idx], frontier[-1] = frontier[-1], frontier[idx]
+        r1, c1, r2, c2, direction = frontier.pop()
 
         # If the neighbor hasn't been visited
-        if not visited[r2][c2]:
+        if not visited[r2, c2]:
             # Carve passage
-            maze.carve(r1, c1, r2, c2)
+            maze._carve(r1, c1, direction)
 
             # Mark neighbor as visited
-            visited[r2][c2] = True
-
-            # Add neighbor's walls to frontier
-            for nr, nc, _, _ in maze.neighbors(r2, c2):
-                if not visited[nr][nc]:
-                    # Avoid duplicates by checking if wall already in frontier
-                    wall = (r2, c2, nr, nc)
-                    if wall not in frontier:
-                        frontier.append(wall)
\ No newline at end of file
+            visited[r2, c2] = True
+
+            # Add neighbor's walls to frontier. Duplicates are harmless:
+            # the visited check above skips any wall whose target has been
+            # reached in the meantime, so no O(F) membership scan is needed.
+            for dr, dc, ndir, _ in dirs:
+                nr = r2 + dr
+                nc = c2 + dc
+                if 0 <= nr < rows and 0 <= nc < cols and not visited[nr, nc]:
+                    frontier.append((r2, c2, nr, nc, ndir))
\ No newline at end of file
@@ -2,41 +2,97 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from enum import IntFlag
 from typing import Iterator
 
+import numpy as np
 
-class Wall(IntFlag):
-    """Wall flags for each cell."""
+# Wall bitmask constants. These used to be an IntFlag enum, but IntFlag
+# operator dispatch (each & / ~ allocating a new flag instance) showed up
+# in every has_wall and carve call, so they are plain ints now.
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+ALL = NORTH | EAST | SOUTH | WEST
+
+
+class Wall:
+    """Namespace of wall bitmask constants (kept for API compatibility)."""
 
     NONE = 0
-    NORTH = 1
-    EAST = 2
-    SOUTH = 4
-    WEST = 8
-    ALL = NORTH | EAST | SOUTH | WEST
+    NORTH = NORTH
+    EAST = EAST
+    SOUTH = SOUTH
+    WEST = WEST
+    ALL = ALL
+
+
+# Direction lookup keyed by (r2 - r1, c2 - c1): wall on the first cell
+# and the opposite wall on the second cell.
+_CARVE_LUT: dict[tuple[int, int], tuple[int, int]] = {
+    (-1, 0): (NORTH, SOUTH),
+    (0, 1): (EAST, WEST),
+    (1, 0): (SOUTH, NORTH),
+    (0, -1): (WEST, EAST),
+}
+
+# Specialized carve dispatch keyed by wall flag, with both wall masks
+# pre-inverted so Maze._carve is just two AND-assignments.
+_FAST_CARVE: dict[int, tuple[int, int, int, int]] = {
+    wall: (dr, dc, ALL ^ wall, ALL ^ opposite)
+    for (dr, dc), (wall, opposite) in _CARVE_LUT.items()
+}
 
 
-@dataclass
 class Cell:
-    """A single cell in the maze grid."""
+    """A lightweight view of a single cell in the maze grid.
+
+    Cells do not own wall state; they read and write the maze's
+    underlying wall array, so they can be created on demand.
+    """
+
+    __slots__ = ("_maze", "row", "col")
+
+    def __init__(self, maze: Maze, row: int, col: int) -> None:
+        self._maze = maze
+        self.row = row
+        self.col = col
 
-    row: int
-    col: int
-    walls: Wall = field(default_factory=lambda: Wall.ALL)
+    @property
+    def walls(self) -> int:
+        """Wall bitmask for this cell."""
+        return int(self._maze.walls[self.row, self.col])
 
-    def remove_wall(self, direction: Wall) -> None:
+    @walls.setter
+    def walls(self, value: int) -> None:
+        self._maze.walls[self.row, self.col] = int(value)
+
+    def remove_wall(self, direction: int) -> None:
         """Remove a wall in the given direction."""
-        self.walls &= ~direction
+        self._maze.walls[self.row, self.col] &= ALL ^ direction
 
-    def has_wall(self, direction: Wall) -> bool:
+    def has_wall(self, direction: int) -> bool:
         """Check if a wall exists in the given direction."""
-        return bool(self.walls & direction)
+        return bool(self._maze.walls[self.row, self.col] & direction)
 
 
 class Maze:
-    """A rectangular grid maze."""
+    """A rectangular grid maze.
+
+    Wall state is stored as a single ``(rows, cols)`` uint8 array of
+    Wall bitmasks, giving one byte per cell and letting algorithms
+    operate on the raw buffer instead of per-cell objects.
+    """
+
+    #: Neighbor deltas with wall flags: (dr, dc, direction, opposite).
+    #: Hot loops iterate this directly with inlined bounds checks instead
+    #: of going through the neighbors() generator.
+    DIRS: tuple[tuple[int, int, int, int], ...] = (
+        (-1, 0, NORTH, SOUTH),
+        (0, 1, EAST, WEST),
+        (1, 0, SOUTH, NORTH),
+        (0, -1, WEST, EAST),
+    )
 
     def __init__(self, rows: int, cols: int) -> None:
         """Initialize a maze with all walls intact.
@@ -50,34 +106,49 @@ class Maze:
 
         self.rows = rows
         self.cols = cols
-        self.grid: list[list[Cell]] = [
-            [Cell(r, c) for c in range(cols)] for r in range(rows)
-        ]
+        self.walls: np.ndarray = np.full((rows, cols), ALL, dtype=np.uint8)
+
+    @classmethod
+    def from_array(cls, walls: np.ndarray) -> Maze:
+        """Wrap an existing uint8 wall array without copying.
+
+        Args:
+            walls: (rows, cols) uint8 array of wall bitmasks, e.g. one
+                slab of a ``generate_batch`` result
+
+        Returns:
+            Maze viewing (not copying) the given array
+        """
+        if walls.ndim != 2:
+            raise ValueError("Wall array must be 2-dimensional")
+
+        maze = cls(walls.shape[0], walls.shape[1])
+        maze.walls = walls
+        return maze
 
     def __getitem__(self, pos: tuple[int, int]) -> Cell:
-        """Get cell at position (row, col)."""
+        """Get cell view at position (row, col)."""
         row, col = pos
-        return self.grid[row][col]
+        if not self.in_bounds(row, col):
+            raise IndexError(f"Cell position {pos} out of bounds")
+        return Cell(self, row, col)
 
     def in_bounds(self, row: int, col: int) -> bool:
         """Check if position is within maze boundaries."""
         return 0 <= row < self.rows and 0 <= col < self.cols
 
-    def neighbors(self, row: int, col: int) -> Iterator[tuple[int, int, Wall, Wall]]:
+    def neighbors(self, row: int, col: int) -> Iterator[tuple[int, int, int, int]]:
         """Yield valid neighbors with their directions.
 
         Yields:
             (neighbor_row, neighbor_col, direction_to_neighbor, opposite_direction)
         """
-        directions = [
-            (row - 1, col, Wall.NORTH, Wall.SOUTH),  # North
-            (row, col + 1, Wall.EAST, Wall.WEST),  # East
-            (row + 1, col, Wall.SOUTH, Wall.NORTH),  # South
-            (row, col - 1, Wall.WEST, Wall.EAST),  # West
-        ]
-
-        for nr, nc, direction, opposite in directions:
-            if self.in_bounds(nr, nc):
+        rows = self.rows
+        cols = self.cols
+        for dr, dc, direction, opposite in self.DIRS:
+            nr = row + dr
+            nc = col + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
                 yield nr, nc, direction, opposite
 
     def carve(self, r1: int, c1: int, r2: int, c2: int) -> None:
@@ -97,26 +168,54 @@ class Maze:
         if abs(r1 - r2) + abs(c1 - c2) != 1:
             raise ValueError("Cells must be adjacent")
 
-        # Determine direction and carve
-        if r2 == r1 - 1:  # r2 is north of r1
-            self.grid[r1][c1].remove_wall(Wall.NORTH)
-            self.grid[r2][c2].remove_wall(Wall.SOUTH)
-        elif r2 == r1 + 1:  # r2 is south of r1
-            self.grid[r1][c1].remove_wall(Wall.SOUTH)
-            self.grid[r2][c2].remove_wall(Wall.NORTH)
-        elif c2 == c1 + 1:  # c2 is east of c1
-            self.grid[r1][c1].remove_wall(Wall.EAST)
-            self.grid[r2][c2].remove_wall(Wall.WEST)
-        else:  # c2 is west of c1
-            self.grid[r1][c1].remove_wall(Wall.WEST)
-            self.grid[r2][c2].remove_wall(Wall.EAST)
+        wall, opposite = _CARVE_LUT[(r2 - r1, c2 - c1)]
+        self.walls[r1, c1] &= ALL ^ wall
+        self.walls[r2, c2] &= ALL ^ opposite
+
+    def _carve(self, row: int, col: int, direction: int) -> None:
+        """Carve toward ``direction`` without validation.
+
+        Internal fast path for generators iterating already-validated
+        neighbors; use :meth:`carve` for arbitrary cell pairs.
+        """
+        dr, dc, mask, opposite_mask = _FAST_CARVE[direction]
+        walls = self.walls
+        walls[row, col] &= mask
+        walls[row + dr, col + dc] &= opposite_mask
+
+    def wall_bitmask(self) -> np.ndarray:
+        """Return the (rows, cols) uint8 array of raw wall bits.
+
+        Walls are already stored in this form, so no copy is made; the
+        accessor exists so consumers don't depend on the storage layout.
+        """
+        return self.walls
+
+    def compute_open_masks(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute per-direction passability masks.
+
+        Returns:
+            Four (rows, cols) bool arrays (north, east, south, west),
+            True where the corresponding wall is open. Consumers such as
+            the solver index these with raw ints instead of calling
+            has_wall() per cell.
+        """
+        walls = self.walls
+        return (
+            (walls & NORTH) == 0,
+            (walls & EAST) == 0,
+            (walls & SOUTH) == 0,
+            (walls & WEST) == 0,
+        )
 
     def all_cells(self) -> Iterator[Cell]:
         """Iterate over all cells in the maze."""
-        for row in self.grid:
-            yield from row
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield Cell(self, row, col)
 
     def reset(self) -> None:
         """Reset maze to initial state with all walls."""
-        for cell in self.all_cells():
-            cell.walls = Wall.ALL
\ No newline at end of file
+        self.walls.fill(ALL)
@@ -2,64 +2,97 @@
 
 from __future__ import annotations
 
-from collections import deque
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from mazewright.maze import Maze
 
 from mazewright.maze import Wall
 
+# Step back toward the parent cell, keyed by the wall flag stored in the
+# parent-direction array.
+_PARENT_STEP: dict[int, tuple[int, int]] = {
+    Wall.NORTH: (-1, 0),
+    Wall.EAST: (0, 1),
+    Wall.SOUTH: (1, 0),
+    Wall.WEST: (0, -1),
+}
+
+_NO_PARENT = 0
+
 
 def solve_bfs(maze: Maze) -> list[tuple[int, int]] | None:
     """Solve maze using breadth-first search.
-    
+
+    The search runs as a wave propagation over the whole grid: each step
+    expands every frontier cell at once using shifted array slices gated
+    by the wall bitmasks, so per-cell work happens in C instead of the
+    interpreter. The path is reconstructed by walking a parent-direction
+    array back from the goal, avoiding per-step path copies.
+
     Args:
         maze: The maze to solve
-        
+
     Returns:
         List of (row, col) coordinates representing the solution path,
         or None if no solution exists
     """
     start = (0, 0)  # Top-left corner
     end = (maze.rows - 1, maze.cols - 1)  # Bottom-right corner
-    
+
     if not maze.in_bounds(*start) or not maze.in_bounds(*end):
         return None
-    
-    queue = deque([(start, [start])])
-    visited = {start}
-    
-    while queue:
-        (row, col), path = queue.popleft()
-        
-        if (row, col) == end:
-            return path
-            
-        cell = maze[row, col]
-        
-        # Check all four directions
-        directions = [
-            (-1, 0, Wall.NORTH),  # North
-            (0, 1, Wall.EAST),    # East
-            (1, 0, Wall.SOUTH),   # South
-            (0, -1, Wall.WEST),   # West
-        ]
-        
-        for dr, dc, wall_dir in directions:
-            new_row, new_col = row + dr, col + dc
-            
-            if (new_row, new_col) in visited:
-                continue
-                
-            if not maze.in_bounds(new_row, new_col):
-                continue
-                
-            # Check if there's a wall blocking this direction
-            if cell.has_wall(wall_dir):
-                continue
-                
-            visited.add((new_row, new_col))
-            queue.append(((new_row, new_col), path + [(new_row, new_col)]))
-    
-    return None  # No solution found
\ No newline at end of file
+
+    walls = maze.walls
+    open_north, open_east, open_south, open_west = maze.compute_open_masks()
+
+    visited = np.zeros(walls.shape, dtype=bool)
+    frontier = np.zeros(walls.shape, dtype=bool)
+    # Direction from each cell back toward its BFS parent, as a wall flag.
+    parent_dir = np.full(walls.shape, _NO_PARENT, dtype=np.uint8)
+
+    visited[start] = True
+    frontier[start] = True
+
+    while not visited[end] and frontier.any():
+        new_frontier = np.zeros(walls.shape, dtype=bool)
+
+        # Move south: the parent lies north of the newly reached cell.
+        mask = frontier[:-1, :] & open_south[:-1, :] & ~visited[1:, :]
+        new_frontier[1:, :] |= mask
+        parent_dir[1:, :][mask] = Wall.NORTH
+
+        # Move north: the parent lies south.
+        mask = frontier[1:, :] & open_north[1:, :] & ~visited[:-1, :]
+        new_frontier[:-1, :] |= mask
+        parent_dir[:-1, :][mask] = Wall.SOUTH
+
+        # Move east: the parent lies west.
+        mask = frontier[:, :-1] & open_east[:, :-1] & ~visited[:, 1:]
+        new_frontier[:, 1:] |= mask
+        parent_dir[:, 1:][mask] = Wall.WEST
+
+        # Move west: the parent lies east.
+        mask = frontier[:, 1:] & open_west[:, 1:] & ~visited[:, :-1]
+        new_frontier[:, :-1] |= mask
+        parent_dir[:, :-1][mask] = Wall.EAST
+
+        visited |= new_frontier
+        frontier = new_frontier
+
+    if not visited[end]:
+        return None  # No solution found
+
+    # Reconstruct the path by walking parent directions back from the goal.
+    path = [end]
+    row, col = end
+    while (row, col) != start:
+        dr, dc = _PARENT_STEP[int(parent_dir[row, col])]
+        row += dr
+        col += dc
+        path.append((row, col))
+
+    path.reverse()
+    return path
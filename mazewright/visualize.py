@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from io import StringIO
+import os
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO, TextIO
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, Rectangle
 
 if TYPE_CHECKING:
     from mazewright.maze import Maze
@@ -14,6 +21,93 @@ if TYPE_CHECKING:
 from mazewright.maze import Wall
 
 
+# ASCII glyphs as byte values, looked up once at import instead of
+# calling ord() throughout save_ascii.
+_SPACE = ord(" ")
+_CORNER = ord("+")
+_HWALL = ord("-")
+_VWALL = ord("|")
+_STAR = ord("*")
+_NEWLINE = ord("\n")
+_START = ord("S")
+_FINISH = ord("F")
+
+# Wall-line templates, selected by whether coordinates are integral;
+# built once instead of re-deriving the format string per save.
+_SVG_LINE_INT = '    <line x1="%d" y1="%d" x2="%d" y2="%d"/>\n'
+_SVG_LINE_FLOAT = '    <line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f"/>\n'
+
+# Fixed fragments and element templates shared by every document.
+_SVG_POLYLINE = (
+    '  <polyline points="%s" fill="none" stroke="%s" '
+    'stroke-width="%s" opacity="0.8"/>\n'
+)
+_SVG_CIRCLE = '  <circle cx="%s" cy="%s" r="%s" fill="green" opacity="0.8"/>\n'
+_SVG_RECT = (
+    '  <rect x="%s" y="%s" width="%s" height="%s" fill="red" opacity="0.8"/>\n'
+)
+_SVG_GROUP_CLOSE = '  </g>\n'
+_SVG_CLOSE = '</svg>\n'
+
+
+def _fmt(value: float) -> str:
+    """Format a coordinate at two-decimal precision, as short as possible.
+
+    Integral values use the bare integer form and fractional ones drop
+    trailing zeros ("2.50" -> "2.5") to keep the SVG payload small.
+    """
+    if value == int(value):
+        return "%d" % value
+    return ("%.2f" % value).rstrip("0").rstrip(".")
+
+
+@lru_cache(maxsize=32)
+def _svg_prefix(width: float, height: float, background_color: str) -> str:
+    """Cached SVG document header and background rect.
+
+    Identical between saves of same-shaped mazes, so format it once.
+    """
+    return (
+        f'<svg width="{width}" height="{height}" '
+        f'xmlns="http://www.w3.org/2000/svg">\n'
+        f'  <rect width="{width}" height="{height}" fill="{background_color}"/>\n'
+    )
+
+
+@lru_cache(maxsize=32)
+def _svg_wall_open(
+    width: float, height: float, wall_color: str, wall_width: float
+) -> str:
+    """Cached wall-group opening tag plus the four outer border lines."""
+    w = _fmt(width)
+    h = _fmt(height)
+    return (
+        f'  <g stroke="{wall_color}" stroke-width="{wall_width}" '
+        f'stroke-linecap="square">\n'
+        f'    <line x1="0" y1="0" x2="{w}" y2="0"/>\n'
+        f'    <line x1="0" y1="{h}" x2="{w}" y2="{h}"/>\n'
+        f'    <line x1="0" y1="0" x2="0" y2="{h}"/>\n'
+        f'    <line x1="{w}" y1="0" x2="{w}" y2="{h}"/>\n'
+    )
+
+
+@lru_cache(maxsize=4)
+def _figure_pool(
+    rows: int, cols: int, cell_size: float, dpi: int
+) -> tuple[Figure, plt.Axes]:
+    """Reusable figure/axes pairs keyed by output geometry.
+
+    Figure creation dominates batch exports; callers saving many mazes
+    of the same shape reuse one figure and clear the axes between
+    renders instead of paying full setup per save. Built directly via
+    Figure rather than plt.subplots so pooled figures never enter
+    pyplot's global registry — evicted entries are then freed by the
+    garbage collector instead of being kept alive by Gcf.
+    """
+    fig = Figure(figsize=(cols * cell_size, rows * cell_size), dpi=dpi)
+    return fig, fig.add_subplot()
+
+
 def render(
     maze: Maze,
     cell_size: float = 1.0,
@@ -23,6 +117,8 @@ def render(
     start_finish_color: str = "red",
     solution_path: list[tuple[int, int]] | None = None,
     solution_color: str = "blue",
+    ax: plt.Axes | None = None,
+    rasterize_walls: bool = False,
 ) -> plt.Figure:
     """Render a maze as line segments using matplotlib.
 
@@ -35,81 +131,96 @@ def render(
         start_finish_color: Color for start/finish markers
         solution_path: Optional path coordinates to highlight
         solution_color: Color for solution path
+        ax: Optional axes to draw into (cleared first); a new figure is
+            created when omitted
+        rasterize_walls: Rasterize the wall collection during draw;
+            skips per-segment vector path handling when the output is a
+            pixel format anyway
 
     Returns:
         The matplotlib figure
     """
-    fig, ax = plt.subplots(figsize=(maze.cols * cell_size, maze.rows * cell_size))
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(maze.cols * cell_size, maze.rows * cell_size))
+    else:
+        fig = ax.figure
+        ax.cla()
 
-    # Collect wall segments
-    segments = []
-    
-    # Add outer border walls (always present)
-    # Top border
-    segments.append([(0, maze.rows * cell_size), (maze.cols * cell_size, maze.rows * cell_size)])
-    # Bottom border
-    segments.append([(0, 0), (maze.cols * cell_size, 0)])
-    # Left border
-    segments.append([(0, 0), (0, maze.rows * cell_size)])
-    # Right border
-    segments.append([(maze.cols * cell_size, 0), (maze.cols * cell_size, maze.rows * cell_size)])
-
-    for row in range(maze.rows):
-        for col in range(maze.cols):
-            cell = maze[row, col]
-
-            # Calculate cell boundaries in plot coordinates
-            # Note: matplotlib y-axis is inverted, so we flip it
-            x_left = col * cell_size
-            x_right = (col + 1) * cell_size
-            y_top = (maze.rows - row) * cell_size
-            y_bottom = (maze.rows - row - 1) * cell_size
-
-            # Only add internal walls to avoid duplicates at borders
-            # North wall (only if not at top edge)
-            if row > 0 and cell.has_wall(Wall.NORTH):
-                segments.append([(x_left, y_top), (x_right, y_top)])
-            
-            # South wall (only if not at bottom edge)
-            if row < maze.rows - 1 and cell.has_wall(Wall.SOUTH):
-                segments.append([(x_left, y_bottom), (x_right, y_bottom)])
-            
-            # West wall (only if not at left edge)
-            if col > 0 and cell.has_wall(Wall.WEST):
-                segments.append([(x_left, y_bottom), (x_left, y_top)])
-            
-            # East wall (only if not at right edge)
-            if col < maze.cols - 1 and cell.has_wall(Wall.EAST):
-                segments.append([(x_right, y_bottom), (x_right, y_top)])
+    rows, cols = maze.rows, maze.cols
+    walls = maze.wall_bitmask()
+    width = cols * cell_size
+    height = rows * cell_size
+
+    # Internal walls as boolean masks. Carving always clears both sides
+    # of a shared wall, so each interior wall is fully described by the
+    # NORTH flag of the cell below it and the WEST flag of the cell to
+    # its right; scanning only those two directions (with boundary
+    # rows/cols zeroed — those are the borders) halves the segment work.
+    # Note: matplotlib y-axis is inverted, so rows are flipped.
+    north = (walls & Wall.NORTH) != 0
+    north[0, :] = False
+    west = (walls & Wall.WEST) != 0
+    west[:, 0] = False
+
+    north_r, north_c = np.nonzero(north)
+    west_r, west_c = np.nonzero(west)
+
+    # One preallocated float32 buffer holds every segment; matplotlib
+    # accepts the (n, 2, 2) array as-is without per-segment conversion.
+    # The four outer border walls occupy seg[0:4].
+    n_segments = 4 + len(north_r) + len(west_r)
+    seg = np.empty((n_segments, 2, 2), dtype=np.float32)
+    seg[0] = ((0.0, height), (width, height))  # Top border
+    seg[1] = ((0.0, 0.0), (width, 0.0))  # Bottom border
+    seg[2] = ((0.0, 0.0), (0.0, height))  # Left border
+    seg[3] = ((width, 0.0), (width, height))  # Right border
+
+    def fill(i0, x0, y0, x1, y1):
+        """Slice-fill segment endpoints; returns the next free index."""
+        i1 = i0 + len(x0)
+        seg[i0:i1, 0, 0] = x0
+        seg[i0:i1, 0, 1] = y0
+        seg[i0:i1, 1, 0] = x1
+        seg[i0:i1, 1, 1] = y1
+        return i1
+
+    # Cell edge coordinates computed once; per-direction blocks index
+    # these instead of re-multiplying by cell_size.
+    xs = np.arange(cols + 1) * cell_size
+    ys = (rows - np.arange(rows + 1)) * cell_size
+
+    y = ys[north_r]
+    i = fill(4, xs[north_c], y, xs[north_c + 1], y)
+    x = xs[west_c]
+    fill(i, x, ys[west_r + 1], x, ys[west_r])
 
     # Create line collection and add to axes
-    lc = LineCollection(segments, linewidths=wall_width, colors=wall_color)
+    lc = LineCollection(seg, linewidths=wall_width, colors=wall_color,
+                        rasterized=rasterize_walls)
     ax.add_collection(lc)
-    
+
     # Draw solution path if provided
     if solution_path and len(solution_path) > 1:
-        path_x = []
-        path_y = []
-        for row, col in solution_path:
-            # Convert maze coordinates to plot coordinates
-            x = (col + 0.5) * cell_size
-            y = (maze.rows - row - 0.5) * cell_size
-            path_x.append(x)
-            path_y.append(y)
-        
-        ax.plot(path_x, path_y, color=solution_color, linewidth=wall_width * 1.5, 
+        path = np.asarray(solution_path)
+        path_x = (path[:, 1] + 0.5) * cell_size
+        path_y = (rows - path[:, 0] - 0.5) * cell_size
+
+        ax.plot(path_x, path_y, color=solution_color, linewidth=wall_width * 1.5,
                 linestyle='-', alpha=0.8, zorder=10)
     
-    # Add start and finish markers
+    # Add start and finish markers as patches; Line2D markers pay the
+    # full marker-rendering pipeline for what is a single fixed shape.
     # Start at top-left corner (green circle)
     start_x = 0.5 * cell_size
     start_y = (maze.rows - 0.5) * cell_size
-    ax.plot(start_x, start_y, 'o', color='green', markersize=cell_size * 12, label='Start')
-    
+    ax.add_patch(Circle((start_x, start_y), radius=0.3 * cell_size, color='green'))
+
     # Finish at bottom-right corner (red square)
     finish_x = (maze.cols - 0.5) * cell_size
     finish_y = 0.5 * cell_size
-    ax.plot(finish_x, finish_y, 's', color='red', markersize=cell_size * 12, label='Finish')
+    side = 0.6 * cell_size
+    ax.add_patch(Rectangle((finish_x - side / 2, finish_y - side / 2),
+                           side, side, color='red'))
 
     # Set plot properties with padding to ensure border walls are fully visible
     padding = wall_width / 50  # Padding based on wall width to prevent clipping
@@ -120,15 +231,17 @@ def render(
     ax.set_facecolor(background_color)
     fig.patch.set_facecolor(background_color)
 
-    # Remove margins
-    plt.tight_layout(pad=0)
+    # Remove margins. tight_layout would solve the full constraint
+    # system with renderer round-trips; for a single borderless axes the
+    # answer is always "fill the figure", so set it directly.
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
 
     return fig
 
 
 def save(
     maze: Maze,
-    filename: str,
+    filename: str | BinaryIO,
     cell_size: float = 20.0,
     wall_width: float = 2.0,
     dpi: int = 100,
@@ -140,7 +253,8 @@ def save(
 
     Args:
         maze: The maze to save
-        filename: Output filename
+        filename: Output filename, or a binary file-like object to
+            receive the PNG bytes (skips the filesystem entirely)
         cell_size: Size of each cell in pixels
         wall_width: Width of wall lines
         dpi: Dots per inch for output
@@ -151,24 +265,312 @@ def save(
     # Convert cell_size from pixels to inches for matplotlib
     cell_size_inches = cell_size / dpi
 
-    fig = render(
+    fig, ax = _figure_pool(maze.rows, maze.cols, cell_size_inches, dpi)
+    render(
         maze,
         cell_size=cell_size_inches,
         wall_width=wall_width,
         start_finish_color=start_finish_color,
         solution_path=solution_path,
         solution_color=solution_color,
+        ax=ax,
+        rasterize_walls=True,  # save() targets raster output at fixed dpi
     )
 
-    fig.savefig(filename, dpi=dpi, bbox_inches="tight", pad_inches=0.05)
-    plt.close(fig)
+    # No bbox_inches="tight": that triggers a second full render pass to
+    # measure the figure, and render() already sets exact data limits
+    # and zero margins. File-like targets need the format spelled out.
+    if hasattr(filename, "write"):
+        fig.savefig(filename, dpi=dpi, format="png")
+    else:
+        # Pre-open with a large buffer: the image encoder emits many
+        # small writes that would otherwise flush every 8 KiB. savefig
+        # can't infer the format from a file object, so derive it from
+        # the extension as it would have from the path.
+        fmt = os.path.splitext(filename)[1][1:].lower() or "png"
+        with open(filename, "wb", buffering=128 * 1024) as f:
+            fig.savefig(f, dpi=dpi, format=fmt)
+    # The figure stays open in the pool for the next save of this shape.
 
 
-def save_svg(
+# Executor for save_async, created on first use so importing the module
+# never spawns threads.
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def save_async(
     maze: Maze,
     filename: str,
     cell_size: float = 20.0,
     wall_width: float = 2.0,
+    dpi: int = 100,
+    start_finish_color: str = "red",
+    solution_path: list[tuple[int, int]] | None = None,
+    solution_color: str = "blue",
+) -> Future:
+    """Save a maze visualization on a background thread.
+
+    Batch exports are dominated by matplotlib draw and PNG encode time,
+    most of which runs in C and releases the GIL; submitting the save
+    to a thread pool lets the caller start generating the next maze
+    immediately. Each task draws into its own figure (never the shared
+    pool used by :func:`save`), so tasks are independent.
+
+    Args:
+        maze: The maze to save
+        filename: Output filename
+        cell_size: Size of each cell in pixels
+        wall_width: Width of wall lines
+        dpi: Dots per inch for output
+        start_finish_color: Color for start/finish markers
+        solution_path: Optional path coordinates to highlight
+        solution_color: Color for solution path
+
+    Returns:
+        Future resolving (to None) once the file is written
+    """
+    cell_size_inches = cell_size / dpi
+
+    def task() -> None:
+        # Build the figure without pyplot so no global figure-manager
+        # state is touched from the worker thread.
+        fig = Figure(
+            figsize=(maze.cols * cell_size_inches, maze.rows * cell_size_inches),
+            dpi=dpi,
+        )
+        render(
+            maze,
+            cell_size=cell_size_inches,
+            wall_width=wall_width,
+            start_finish_color=start_finish_color,
+            solution_path=solution_path,
+            solution_color=solution_color,
+            ax=fig.add_subplot(),
+            rasterize_walls=True,
+        )
+        fig.savefig(filename, dpi=dpi)
+
+    return _get_executor().submit(task)
+
+
+def _png_chunk(tag: bytes, payload: bytes) -> bytes:
+    """Frame one PNG chunk: length, tag, payload, CRC."""
+    return (
+        struct.pack(">I", len(payload))
+        + tag
+        + payload
+        + struct.pack(">I", zlib.crc32(tag + payload))
+    )
+
+
+def save_png_bitmap(
+    maze: Maze,
+    filename: str | BinaryIO,
+    cell_px: int = 8,
+) -> None:
+    """Save a bare walls-only PNG without going through matplotlib.
+
+    For bulk export of small mazes, :func:`save` is dominated by
+    matplotlib's draw machinery rather than the pixels themselves. This
+    writes a 1-bit grayscale PNG (black walls on white) using only the
+    stdlib: the wall masks are painted into a bitmap, packed to bits,
+    and deflated straight into IDAT. No markers or solution overlay —
+    use :func:`save` when presentation matters.
+
+    Args:
+        maze: The maze to save
+        filename: Output filename, or a binary file-like object
+        cell_px: Interior pixels per cell; walls are one pixel wide
+    """
+    if cell_px <= 0:
+        raise ValueError("cell_px must be positive")
+
+    rows, cols = maze.rows, maze.cols
+    walls = maze.wall_bitmask()
+    height = rows * cell_px + 1
+    width = cols * cell_px + 1
+
+    # 1 = white background, 0 = black wall. Like the ASCII renderer,
+    # only NORTH/WEST walls plus the closing borders need painting.
+    img = np.ones((height, width), dtype=np.uint8)
+    img[-1, :] = 0
+    img[:, -1] = 0
+
+    rr, cc = np.nonzero((walls & Wall.NORTH) != 0)
+    for k in range(cell_px + 1):
+        img[rr * cell_px, cc * cell_px + k] = 0
+    rr, cc = np.nonzero((walls & Wall.WEST) != 0)
+    for k in range(cell_px + 1):
+        img[rr * cell_px + k, cc * cell_px] = 0
+
+    # Each scanline is packed to bits and prefixed with filter type 0.
+    packed = np.packbits(img, axis=1)
+    raw = b"".join(b"\x00" + row.tobytes() for row in packed)
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 1, 0, 0, 0, 0)
+    data = (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", ihdr)
+        + _png_chunk(b"IDAT", zlib.compress(raw))
+        + _png_chunk(b"IEND", b"")
+    )
+
+    if hasattr(filename, "write"):
+        filename.write(data)
+    else:
+        with open(filename, "wb") as f:
+            f.write(data)
+
+
+def _svg_parts(
+    maze: Maze,
+    cell_size: float,
+    wall_width: float,
+    wall_color: str,
+    background_color: str,
+    solution_path: list[tuple[int, int]] | None,
+    solution_color: str,
+) -> list[str]:
+    """Build the SVG document as a list of markup fragments."""
+    rows, cols = maze.rows, maze.cols
+    walls = maze.wall_bitmask()
+
+    # Integral cell sizes put every wall on an integer coordinate, which
+    # formats shorter ("20" vs "20.0") and shrinks the output file;
+    # otherwise quantize to two decimals.
+    if float(cell_size).is_integer():
+        cell_size = int(cell_size)
+        line = _SVG_LINE_INT
+    else:
+        line = _SVG_LINE_FLOAT
+
+    width = cols * cell_size
+    height = rows * cell_size
+
+    # Accumulate fragments in a list and join once at the end; per-wall
+    # StringIO writes with f-string formatting dominated large exports.
+    parts: list[str] = []
+    emit = parts.append
+
+    fmt = _fmt
+
+    emit(_svg_prefix(width, height, background_color))
+
+    # Draw solution path first (so it appears under walls)
+    if solution_path and len(solution_path) > 1:
+        points_str = " ".join(
+            "%s,%s" % (fmt((col + 0.5) * cell_size), fmt((row + 0.5) * cell_size))
+            for row, col in solution_path
+        )
+        emit(_SVG_POLYLINE % (points_str, solution_color, wall_width * 1.5))
+
+    # Draw walls: the group opening tag and the four outer borders are
+    # static for a given geometry, so they come from the prefix cache.
+    emit(_svg_wall_open(width, height, wall_color, wall_width))
+
+    # Draw internal walls: boolean masks per direction (boundary rows and
+    # columns zeroed, those are the borders above), then bulk-format the
+    # endpoint arrays. Unlike render(), the SVG y-axis grows downward.
+    def emit_lines(x1, y1, x2, y2):
+        parts.extend(
+            line % coords
+            for coords in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist())
+        )
+
+    north = (walls & Wall.NORTH) != 0
+    north[0, :] = False
+    rr, cc = np.nonzero(north)
+    y = rr * cell_size
+    emit_lines(cc * cell_size, y, (cc + 1) * cell_size, y)
+
+    south = (walls & Wall.SOUTH) != 0
+    south[-1, :] = False
+    rr, cc = np.nonzero(south)
+    y = (rr + 1) * cell_size
+    emit_lines(cc * cell_size, y, (cc + 1) * cell_size, y)
+
+    west = (walls & Wall.WEST) != 0
+    west[:, 0] = False
+    rr, cc = np.nonzero(west)
+    x = cc * cell_size
+    emit_lines(x, rr * cell_size, x, (rr + 1) * cell_size)
+
+    east = (walls & Wall.EAST) != 0
+    east[:, -1] = False
+    rr, cc = np.nonzero(east)
+    x = (cc + 1) * cell_size
+    emit_lines(x, rr * cell_size, x, (rr + 1) * cell_size)
+
+    emit(_SVG_GROUP_CLOSE)
+
+    # Draw start and finish markers
+    start_x = 0.5 * cell_size
+    start_y = 0.5 * cell_size
+    emit(_SVG_CIRCLE % (fmt(start_x), fmt(start_y), fmt(cell_size * 0.3)))
+
+    finish_x = (cols - 0.5) * cell_size
+    finish_y = (rows - 0.5) * cell_size
+    emit(_SVG_RECT
+         % (fmt(finish_x - cell_size * 0.3), fmt(finish_y - cell_size * 0.3),
+            fmt(cell_size * 0.6), fmt(cell_size * 0.6)))
+
+    emit(_SVG_CLOSE)
+
+    return parts
+
+
+def render_svg(
+    maze: Maze,
+    cell_size: float = 20.0,
+    wall_width: float = 2.0,
+    wall_color: str = "black",
+    background_color: str = "white",
+    start_finish_color: str = "red",
+    solution_path: list[tuple[int, int]] | None = None,
+    solution_color: str = "blue",
+) -> str:
+    """Render a maze as an SVG document string.
+
+    Useful when the markup is consumed in memory (embedding, testing)
+    and a file round-trip would be wasted work; :func:`save_svg` is the
+    file-writing counterpart.
+
+    Args:
+        maze: The maze to render
+        cell_size: Size of each cell in pixels
+        wall_width: Width of wall lines
+        wall_color: Color of walls
+        background_color: Background color
+        start_finish_color: Color for start/finish markers
+        solution_path: Optional path coordinates to highlight
+        solution_color: Color for solution path
+
+    Returns:
+        The complete SVG markup
+    """
+    return "".join(_svg_parts(
+        maze,
+        cell_size,
+        wall_width,
+        wall_color,
+        background_color,
+        solution_path,
+        solution_color,
+    ))
+
+
+def save_svg(
+    maze: Maze,
+    filename: str | TextIO,
+    cell_size: float = 20.0,
+    wall_width: float = 2.0,
     wall_color: str = "black",
     background_color: str = "white",
     start_finish_color: str = "red",
@@ -176,10 +578,11 @@ def save_svg(
     solution_color: str = "blue",
 ) -> None:
     """Save a maze as an SVG file.
-    
+
     Args:
         maze: The maze to save
-        filename: Output filename (should end with .svg)
+        filename: Output filename (should end with .svg), or a text
+            file-like object to receive the markup
         cell_size: Size of each cell in pixels
         wall_width: Width of wall lines
         wall_color: Color of walls
@@ -188,146 +591,93 @@ def save_svg(
         solution_path: Optional path coordinates to highlight
         solution_color: Color for solution path
     """
-    width = maze.cols * cell_size
-    height = maze.rows * cell_size
-    
-    svg_content = StringIO()
-    svg_content.write(f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">\n')
-    svg_content.write(f'  <rect width="{width}" height="{height}" fill="{background_color}"/>\n')
-    
-    # Draw solution path first (so it appears under walls)
-    if solution_path and len(solution_path) > 1:
-        path_points = []
-        for row, col in solution_path:
-            x = (col + 0.5) * cell_size
-            y = (row + 0.5) * cell_size
-            path_points.append(f"{x},{y}")
-        
-        points_str = " ".join(path_points)
-        svg_content.write(f'  <polyline points="{points_str}" fill="none" stroke="{solution_color}" '
-                         f'stroke-width="{wall_width * 1.5}" opacity="0.8"/>\n')
-    
-    # Draw walls
-    svg_content.write(f'  <g stroke="{wall_color}" stroke-width="{wall_width}" stroke-linecap="square">\n')
-    
-    # Draw outer borders
-    svg_content.write(f'    <line x1="0" y1="0" x2="{width}" y2="0"/>\n')  # Top
-    svg_content.write(f'    <line x1="0" y1="{height}" x2="{width}" y2="{height}"/>\n')  # Bottom
-    svg_content.write(f'    <line x1="0" y1="0" x2="0" y2="{height}"/>\n')  # Left
-    svg_content.write(f'    <line x1="{width}" y1="0" x2="{width}" y2="{height}"/>\n')  # Right
-    
-    # Draw internal walls
-    for row in range(maze.rows):
-        for col in range(maze.cols):
-            cell = maze[row, col]
-            
-            x_left = col * cell_size
-            x_right = (col + 1) * cell_size
-            y_top = row * cell_size
-            y_bottom = (row + 1) * cell_size
-            
-            # Only draw internal walls to avoid duplicates
-            if row > 0 and cell.has_wall(Wall.NORTH):
-                svg_content.write(f'    <line x1="{x_left}" y1="{y_top}" x2="{x_right}" y2="{y_top}"/>\n')
-            
-            if row < maze.rows - 1 and cell.has_wall(Wall.SOUTH):
-                svg_content.write(f'    <line x1="{x_left}" y1="{y_bottom}" x2="{x_right}" y2="{y_bottom}"/>\n')
-            
-            if col > 0 and cell.has_wall(Wall.WEST):
-                svg_content.write(f'    <line x1="{x_left}" y1="{y_top}" x2="{x_left}" y2="{y_bottom}"/>\n')
-            
-            if col < maze.cols - 1 and cell.has_wall(Wall.EAST):
-                svg_content.write(f'    <line x1="{x_right}" y1="{y_top}" x2="{x_right}" y2="{y_bottom}"/>\n')
-    
-    svg_content.write('  </g>\n')
-    
-    # Draw start and finish markers
-    start_x = 0.5 * cell_size
-    start_y = 0.5 * cell_size
-    svg_content.write(f'  <circle cx="{start_x}" cy="{start_y}" r="{cell_size * 0.3}" '
-                     f'fill="green" opacity="0.8"/>\n')
-    
-    finish_x = (maze.cols - 0.5) * cell_size
-    finish_y = (maze.rows - 0.5) * cell_size
-    svg_content.write(f'  <rect x="{finish_x - cell_size * 0.3}" y="{finish_y - cell_size * 0.3}" '
-                     f'width="{cell_size * 0.6}" height="{cell_size * 0.6}" '
-                     f'fill="red" opacity="0.8"/>\n')
-    
-    svg_content.write('</svg>\n')
-    
-    with open(filename, 'w') as f:
-        f.write(svg_content.getvalue())
+    parts = _svg_parts(
+        maze,
+        cell_size,
+        wall_width,
+        wall_color,
+        background_color,
+        solution_path,
+        solution_color,
+    )
+
+    # Stream the fragments straight to the target; joining first would
+    # materialize a second full-size copy of the document.
+    if hasattr(filename, "write"):
+        filename.writelines(parts)
+    else:
+        # Large buffer amortizes write(2) overhead over the many small
+        # line fragments.
+        with open(filename, 'w', buffering=128 * 1024) as f:
+            f.writelines(parts)
 
 
 def save_ascii(
     maze: Maze,
     filename: str | None = None,
     solution_path: list[tuple[int, int]] | None = None,
-) -> str:
+    as_bytes: bool = False,
+) -> str | bytes:
     """Save or return a maze as ASCII art.
-    
+
     Args:
         maze: The maze to render
         filename: Optional output filename. If None, returns the ASCII string
         solution_path: Optional path coordinates to mark with asterisks
-        
+        as_bytes: Return the raw ASCII bytes instead of decoding to str;
+            the output is pure ASCII, so callers that only scan or write
+            the result can skip the decode
+
     Returns:
         The ASCII representation of the maze (also written to file if filename provided)
     """
-    # Create a 2D grid for the ASCII representation
-    # Each cell needs 3x3 characters to show walls and paths
-    ascii_height = maze.rows * 2 + 1
-    ascii_width = maze.cols * 4 + 1
-    grid = [[' ' for _ in range(ascii_width)] for _ in range(ascii_height)]
-    
-    # Convert solution path to set for quick lookup
-    solution_set = set(solution_path) if solution_path else set()
-    
-    # Draw the maze
-    for row in range(maze.rows):
-        for col in range(maze.cols):
-            cell = maze[row, col]
-            
-            # Calculate position in ASCII grid
-            ascii_row = row * 2
-            ascii_col = col * 4
-            
-            # Draw corners
-            grid[ascii_row][ascii_col] = '+'
-            grid[ascii_row][ascii_col + 4] = '+'
-            grid[ascii_row + 2][ascii_col] = '+'
-            grid[ascii_row + 2][ascii_col + 4] = '+'
-            
-            # Draw walls
-            if cell.has_wall(Wall.NORTH):
-                for i in range(1, 4):
-                    grid[ascii_row][ascii_col + i] = '-'
-            
-            if cell.has_wall(Wall.SOUTH):
-                for i in range(1, 4):
-                    grid[ascii_row + 2][ascii_col + i] = '-'
-            
-            if cell.has_wall(Wall.WEST):
-                grid[ascii_row + 1][ascii_col] = '|'
-            
-            if cell.has_wall(Wall.EAST):
-                grid[ascii_row + 1][ascii_col + 4] = '|'
-            
-            # Mark solution path
-            if (row, col) in solution_set:
-                grid[ascii_row + 1][ascii_col + 2] = '*'
-            
-            # Mark start and finish
-            if row == 0 and col == 0:
-                grid[ascii_row + 1][ascii_col + 2] = 'S'
-            elif row == maze.rows - 1 and col == maze.cols - 1:
-                grid[ascii_row + 1][ascii_col + 2] = 'F'
-    
-    # Convert grid to string
-    ascii_str = '\n'.join(''.join(row) for row in grid)
-    
+    rows, cols = maze.rows, maze.cols
+    walls = maze.wall_bitmask()
+
+    # Each cell spans 2 grid rows and 4 grid columns, plus closing borders
+    ascii_height = rows * 2 + 1
+    ascii_width = cols * 4 + 1
+    # One byte per character instead of the 4-byte unicode dtype; the
+    # output is pure ASCII so the final decode is a straight copy. An
+    # extra column holds each row's newline so the whole buffer decodes
+    # in one shot rather than joining per-row strings.
+    grid = np.full((ascii_height, ascii_width + 1), _SPACE, dtype=np.uint8)
+    grid[:, -1] = _NEWLINE
+
+    # Corners in one strided assignment
+    grid[::2, ::4] = _CORNER
+
+    # Horizontal walls: every wall is drawn once as the north wall of its
+    # cell; the bottom border comes from the last row's south walls.
+    rr, cc = np.nonzero((walls & Wall.NORTH) != 0)
+    for offset in (1, 2, 3):
+        grid[rr * 2, cc * 4 + offset] = _HWALL
+    (cc,) = np.nonzero((walls[-1, :] & Wall.SOUTH) != 0)
+    for offset in (1, 2, 3):
+        grid[rows * 2, cc * 4 + offset] = _HWALL
+
+    # Vertical walls: west walls per cell, right border from the last
+    # column's east walls.
+    rr, cc = np.nonzero((walls & Wall.WEST) != 0)
+    grid[rr * 2 + 1, cc * 4] = _VWALL
+    (rr,) = np.nonzero((walls[:, -1] & Wall.EAST) != 0)
+    grid[rr * 2 + 1, cols * 4] = _VWALL
+
+    # Mark solution path with one fancy-indexed assignment
+    if solution_path:
+        path = np.asarray(solution_path)
+        grid[path[:, 0] * 2 + 1, path[:, 1] * 4 + 2] = _STAR
+
+    # Mark start and finish; finish first so the start marker wins when
+    # both land on the same cell (1x1 maze)
+    grid[rows * 2 - 1, cols * 4 - 2] = _FINISH
+    grid[1, 2] = _START
+
+    # Flatten the grid in one pass, dropping the final newline
+    raw = grid.tobytes()[:-1]
+
     if filename:
-        with open(filename, 'w') as f:
-            f.write(ascii_str)
-    
-    return ascii_str
\ No newline at end of file
+        with open(filename, 'wb') as f:
+            f.write(raw)
+
+    return raw if as_bytes else raw.decode("ascii")
\ No newline at end of file
@@ -2,18 +2,85 @@
 
 from __future__ import annotations
 
-from collections import deque
-
+import numpy as np
 import pytest
 
-from mazewright import Maze, Wall, generate
+from mazewright import Maze, Wall, generate, generate_batch
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; validate in pure Python
+    njit = None
+
+# Wall flags as module ints so Numba can treat them as compile-time
+# constants inside the kernel.
+_NORTH = int(Wall.NORTH)
+_EAST = int(Wall.EAST)
+_SOUTH = int(Wall.SOUTH)
+_WEST = int(Wall.WEST)
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _bfs_perfect(bits: np.ndarray, rows: int, cols: int) -> bool:
+        """Edge count + flood fill over the raw wall bitmask."""
+        edges = 0
+        for r in range(rows):
+            for c in range(cols):
+                w = bits[r, c]
+                if c < cols - 1 and w & _EAST == 0:
+                    edges += 1
+                if r < rows - 1 and w & _SOUTH == 0:
+                    edges += 1
+        if edges != rows * cols - 1:
+            return False
+
+        visited = np.zeros(rows * cols, dtype=np.uint8)
+        stack = np.empty(rows * cols, dtype=np.int32)
+        stack[0] = 0
+        top = 1
+        visited[0] = 1
+        reachable = 1
+        while top > 0:
+            top -= 1
+            v = stack[top]
+            r = v // cols
+            c = v % cols
+            w = bits[r, c]
+            if r > 0 and w & _NORTH == 0 and visited[v - cols] == 0:
+                visited[v - cols] = 1
+                reachable += 1
+                stack[top] = v - cols
+                top += 1
+            if c < cols - 1 and w & _EAST == 0 and visited[v + 1] == 0:
+                visited[v + 1] = 1
+                reachable += 1
+                stack[top] = v + 1
+                top += 1
+            if r < rows - 1 and w & _SOUTH == 0 and visited[v + cols] == 0:
+                visited[v + cols] = 1
+                reachable += 1
+                stack[top] = v + cols
+                top += 1
+            if c > 0 and w & _WEST == 0 and visited[v - 1] == 0:
+                visited[v - 1] = 1
+                reachable += 1
+                stack[top] = v - 1
+                top += 1
+        return reachable == rows * cols
+
+else:
+    _bfs_perfect = None
 
 
 def is_perfect_maze(maze: Maze) -> bool:
     """Check if a maze is perfect (all cells reachable, no cycles).
 
     A perfect maze has exactly rows*cols-1 carved edges and all cells
-    are reachable from any starting point.
+    are reachable from any starting point. When Numba is installed the
+    check runs as a compiled kernel over the wall bitmask; every
+    parametrized test calls this, so the per-cell Python loop was a
+    noticeable share of suite runtime.
 
     Args:
         maze: The maze to validate
@@ -21,6 +88,13 @@ def is_perfect_maze(maze: Maze) -> bool:
     Returns:
         True if maze is perfect
     """
+    if _bfs_perfect is not None:
+        return bool(_bfs_perfect(maze.wall_bitmask(), maze.rows, maze.cols))
+    return _is_perfect_maze_py(maze)
+
+
+def _is_perfect_maze_py(maze: Maze) -> bool:
+    """Pure-Python fallback for :func:`is_perfect_maze`."""
     # Count carved edges
     carved_edges = 0
     for row in range(maze.rows):
@@ -36,14 +110,24 @@ def is_perfect_maze(maze: Maze) -> bool:
     if carved_edges != expected_edges:
         return False
 
-    # Check all cells are reachable using BFS
-    visited = [[False] * maze.cols for _ in range(maze.rows)]
-    queue = deque([(0, 0)])
-    visited[0][0] = True
+    # Check all cells are reachable using BFS. The queue is a
+    # preallocated int32 ring buffer of r*cols+c encoded cells; deque
+    # popleft and per-cell tuple churn dominated this pass on large
+    # mazes.
+    # Visited is a flat bytearray indexed by the same encoding: one byte
+    # per cell and a single subscript instead of nested list lookups.
+    rows, cols = maze.rows, maze.cols
+    visited = bytearray(rows * cols)
+    queue = np.empty(rows * cols, dtype=np.int32)
+    queue[0] = 0
+    head = 0
+    tail = 1
+    visited[0] = 1
     reachable_count = 1
 
-    while queue:
-        row, col = queue.popleft()
+    while head < tail:
+        row, col = divmod(int(queue[head]), cols)
+        head += 1
         cell = maze[row, col]
 
         # Check each direction
@@ -57,14 +141,15 @@ def is_perfect_maze(maze: Maze) -> bool:
         for nr, nc, wall_dir in directions:
             if (
                 maze.in_bounds(nr, nc)
-                and not visited[nr][nc]
+                and not visited[nr * cols + nc]
                 and not cell.has_wall(wall_dir)
             ):
-                visited[nr][nc] = True
+                visited[nr * cols + nc] = 1
                 reachable_count += 1
-                queue.append((nr, nc))
+                queue[tail] = nr * cols + nc
+                tail += 1
 
-    return reachable_count == maze.rows * maze.cols
+    return reachable_count == rows * cols
 
 
 class TestMazeDataStructure:
@@ -166,4 +251,22 @@ class TestAPI:
     def test_invalid_algorithm(self) -> None:
         """Test that invalid algorithm raises error."""
         with pytest.raises(ValueError, match="Unknown algorithm"):
-            generate(5, 5, algorithm="invalid")  # type: ignore
\ No newline at end of file
+            generate(5, 5, algorithm="invalid")  # type: ignore
+
+    def test_generate_batch(self) -> None:
+        """Test batch generation produces perfect mazes in one buffer."""
+        batch = generate_batch(4, 6, 5)
+        assert batch.shape == (4, 6, 5)
+        assert batch.dtype == np.uint8
+
+        for walls in batch:
+            assert is_perfect_maze(Maze.from_array(walls))
+
+    def test_generate_batch_invalid(self) -> None:
+        """Test that invalid batch arguments raise errors."""
+        with pytest.raises(ValueError):
+            generate_batch(-1, 5, 5)
+        with pytest.raises(ValueError):
+            generate_batch(2, 0, 5)
+        with pytest.raises(ValueError, match="Unknown algorithm"):
+            generate_batch(2, 5, 5, algorithm="invalid")  # type: ignore
\ No newline at end of file
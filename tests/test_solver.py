@@ -0,0 +1,64 @@
+"""Tests for maze solving."""
+
+from __future__ import annotations
+
+import pytest
+
+from mazewright import Maze, generate
+from mazewright.solver import solve_bfs
+
+
+def is_valid_path(maze: Maze, path: list[tuple[int, int]]) -> bool:
+    """Check that a path is connected, in bounds, and crosses no walls.
+
+    Args:
+        maze: The maze the path traverses
+        path: List of (row, col) coordinates
+
+    Returns:
+        True if each step moves to an adjacent cell through an open wall
+    """
+    from mazewright.maze import _CARVE_LUT
+
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        if not (maze.in_bounds(r1, c1) and maze.in_bounds(r2, c2)):
+            return False
+        delta = (r2 - r1, c2 - c1)
+        if delta not in _CARVE_LUT:
+            return False  # Not adjacent
+        wall, _ = _CARVE_LUT[delta]
+        if maze[r1, c1].has_wall(wall):
+            return False
+    return True
+
+
+class TestSolver:
+    """Test the BFS solver."""
+
+    @pytest.mark.parametrize("algorithm", ["backtracker", "prim", "kruskal"])
+    def test_solves_generated_maze(self, algorithm: str) -> None:
+        """Test that generated mazes are solved corner to corner."""
+        maze = generate(10, 10, algorithm=algorithm)
+        path = solve_bfs(maze)
+
+        assert path is not None
+        assert path[0] == (0, 0)
+        assert path[-1] == (maze.rows - 1, maze.cols - 1)
+        assert is_valid_path(maze, path)
+
+    def test_single_cell(self) -> None:
+        """Test solving a single-cell maze."""
+        maze = generate(1, 1)
+        assert solve_bfs(maze) == [(0, 0)]
+
+    def test_unsolvable_maze(self) -> None:
+        """Test that a maze with all walls intact has no solution."""
+        maze = Maze(3, 3)  # No passages carved
+        assert solve_bfs(maze) is None
+
+    def test_path_has_no_duplicates(self) -> None:
+        """Test that the solution path never revisits a cell."""
+        maze = generate(8, 8)
+        path = solve_bfs(maze)
+        assert path is not None
+        assert len(path) == len(set(path))
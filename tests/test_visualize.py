@@ -2,75 +2,127 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+import io
+import struct
 
 import pytest
 
 from mazewright import generate
-from mazewright.visualize import save, save_svg, save_ascii
+from mazewright.visualize import (
+    render_svg,
+    save,
+    save_ascii,
+    save_async,
+    save_png_bitmap,
+    save_svg,
+)
 from mazewright.solver import solve_bfs
 
 
+@pytest.fixture(scope="module")
+def small_maze():
+    """A 5x5 maze generated once and shared; serializers don't mutate it."""
+    return generate(5, 5)
+
+
+@pytest.fixture(scope="module")
+def tiny_maze():
+    """A 3x3 maze generated once and shared across tests."""
+    return generate(3, 3)
+
+
+@pytest.fixture(scope="module")
+def tmp_visdir(tmp_path_factory):
+    """One temp directory for every file-writing test in this module.
+
+    Amortizes directory creation/cleanup across tests; each test writes
+    to its own uniquely named file inside it.
+    """
+    return tmp_path_factory.mktemp("vis")
+
+
+@pytest.fixture(scope="module")
+def small_solution(small_maze):
+    """The BFS solution of small_maze, solved once for all solution tests."""
+    return solve_bfs(small_maze)
+
+
 class TestVisualization:
     """Test visualization functions."""
 
-    def test_save_png(self) -> None:
+    def test_save_png(self, small_maze, tmp_visdir) -> None:
         """Test saving maze as PNG."""
-        maze = generate(5, 5)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "maze.png"
-            save(maze, str(filepath))
-            assert filepath.exists()
-            assert filepath.stat().st_size > 0
-
-    def test_save_png_with_solution(self) -> None:
-        """Test saving maze with solution as PNG."""
-        maze = generate(5, 5)
-        solution = solve_bfs(maze)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "maze_solved.png"
-            save(maze, str(filepath), solution_path=solution)
-            assert filepath.exists()
-            assert filepath.stat().st_size > 0
+        maze = small_maze
+
+        filepath = tmp_visdir / "maze.png"
+        save(maze, str(filepath))
+        assert filepath.exists()
+        assert filepath.stat().st_size > 0
+
+    def test_save_png_with_solution(self, small_maze, small_solution) -> None:
+        """Test saving maze with solution as PNG to an in-memory buffer."""
+        maze = small_maze
+        solution = small_solution
+
+        buf = io.BytesIO()
+        save(maze, buf, solution_path=solution)
+        data = buf.getvalue()
+        assert data.startswith(b"\x89PNG")
+        assert len(data) > 0
+
+    def test_save_async(self, small_maze, tmp_visdir) -> None:
+        """Test background saving resolves and writes a PNG."""
+        maze = small_maze
+
+        filepath = tmp_visdir / "maze_async.png"
+        future = save_async(maze, str(filepath))
+        assert future.result(timeout=30) is None
+        assert filepath.exists()
+        assert filepath.read_bytes().startswith(b"\x89PNG")
 
-    def test_save_svg(self) -> None:
+    def test_save_png_bitmap(self, small_maze) -> None:
+        """Test the minimal stdlib PNG writer."""
+        maze = small_maze
+
+        buf = io.BytesIO()
+        save_png_bitmap(maze, buf, cell_px=4)
+        data = buf.getvalue()
+        assert data.startswith(b"\x89PNG")
+        # IHDR width/height match the maze geometry
+        width, height = struct.unpack(">II", data[16:24])
+        assert width == maze.cols * 4 + 1
+        assert height == maze.rows * 4 + 1
+
+    def test_save_svg(self, small_maze, tmp_visdir) -> None:
         """Test saving maze as SVG."""
-        maze = generate(5, 5)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "maze.svg"
-            save_svg(maze, str(filepath))
-            assert filepath.exists()
-            
-            # Check SVG content
-            content = filepath.read_text()
-            assert "<svg" in content
-            assert "</svg>" in content
-            assert "line" in content  # Should have wall lines
-            assert "circle" in content  # Start marker
-            assert "rect" in content  # Finish marker
-
-    def test_save_svg_with_solution(self) -> None:
-        """Test saving maze with solution as SVG."""
-        maze = generate(5, 5)
-        solution = solve_bfs(maze)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "maze_solved.svg"
-            save_svg(maze, str(filepath), solution_path=solution)
-            assert filepath.exists()
-            
-            content = filepath.read_text()
-            assert "<svg" in content
-            assert "polyline" in content  # Solution path
-
-    def test_save_ascii(self) -> None:
+        maze = small_maze
+
+        filepath = tmp_visdir / "maze.svg"
+        save_svg(maze, str(filepath))
+        assert filepath.exists()
+
+        # Check SVG content; raw bytes skip the UTF-8 decode and
+        # substring-scan the narrow buffer directly
+        content = filepath.read_bytes()
+        assert b"<svg" in content
+        assert b"</svg>" in content
+        assert b"line" in content  # Should have wall lines
+        assert b"circle" in content  # Start marker
+        assert b"rect" in content  # Finish marker
+
+    def test_render_svg_with_solution(self, small_maze, small_solution) -> None:
+        """Test rendering maze with solution as an SVG string."""
+        maze = small_maze
+        solution = small_solution
+
+        content = render_svg(maze, solution_path=solution)
+        assert "<svg" in content
+        assert "polyline" in content  # Solution path
+
+    def test_save_ascii(self, tiny_maze, tmp_visdir) -> None:
         """Test saving maze as ASCII art."""
-        maze = generate(3, 3)
-        
+        maze = tiny_maze
+
         # Test returning ASCII string
         ascii_str = save_ascii(maze)
         assert isinstance(ascii_str, str)
@@ -81,24 +133,23 @@ class TestVisualization:
         assert "F" in ascii_str  # Finish marker
         
         # Test saving to file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "maze.txt"
-            save_ascii(maze, str(filepath))
-            assert filepath.exists()
-            
-            content = filepath.read_text()
-            assert content == ascii_str
-
-    def test_save_ascii_with_solution(self) -> None:
+        filepath = tmp_visdir / "maze.txt"
+        save_ascii(maze, str(filepath))
+        assert filepath.exists()
+
+        content = filepath.read_text()
+        assert content == ascii_str
+
+    def test_save_ascii_with_solution(self, small_maze, small_solution) -> None:
         """Test saving maze with solution as ASCII art."""
-        maze = generate(5, 5)
-        solution = solve_bfs(maze)
+        maze = small_maze
+        solution = small_solution
         
-        ascii_str = save_ascii(maze, solution_path=solution)
-        assert isinstance(ascii_str, str)
+        ascii_bytes = save_ascii(maze, solution_path=solution, as_bytes=True)
+        assert isinstance(ascii_bytes, bytes)
         # Should have asterisks for solution path (except start/finish)
         # Count asterisks - should be len(solution) - 2 (excluding S and F)
-        asterisk_count = ascii_str.count("*")
+        asterisk_count = ascii_bytes.count(b"*")
         expected_asterisks = len(solution) - 2 if solution else 0
         assert asterisk_count == expected_asterisks
 
@@ -118,20 +169,15 @@ class TestVisualization:
         expected_width = cols * 4 + 1
         assert all(len(line) == expected_width for line in lines)
 
-    def test_svg_custom_colors(self) -> None:
+    def test_svg_custom_colors(self, tiny_maze) -> None:
         """Test SVG with custom colors."""
-        maze = generate(3, 3)
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "colored.svg"
-            save_svg(
-                maze, 
-                str(filepath),
-                wall_color="blue",
-                background_color="yellow",
-                solution_color="red"
-            )
-            
-            content = filepath.read_text()
-            assert 'stroke="blue"' in content
-            assert 'fill="yellow"' in content
\ No newline at end of file
+        maze = tiny_maze
+
+        content = render_svg(
+            maze,
+            wall_color="blue",
+            background_color="yellow",
+            solution_color="red"
+        )
+        assert 'stroke="blue"' in content
+        assert 'fill="yellow"' in content
\ No newline at end of file